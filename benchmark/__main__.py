@@ -0,0 +1,23 @@
+import importlib
+import sys
+
+BENCHMARKS = ["latency", "startup", "dispatch", "strings", "loops", "check", "metrics"]
+
+if __name__ == "__main__":
+    names = sys.argv[1:] or BENCHMARKS
+    for name in names:
+        if name not in BENCHMARKS:
+            print(f"Unknown benchmark: {name}")
+            sys.exit(1)
+
+    failed = []
+    for name in names:
+        print(f"\n--- Benchmark: {name} ---")
+        module = importlib.import_module(f"benchmark.{name}")
+        if module.run() is False:
+            failed.append(name)
+        print("-" * 30)
+
+    if failed:
+        print(f"Over budget: {', '.join(failed)}")
+        sys.exit(1)
@@ -0,0 +1,51 @@
+import os
+import tempfile
+import time
+
+from bulang.providers.checker import Checker
+
+FILES = 2_000
+BROKEN_EVERY = 10
+
+VALID = """int i{n} = 0;
+int total{n} = 0;
+while (i{n} < 10) {{
+    if (i{n} > 5) {{
+        total{n} = total{n} + i{n} * 2;
+    }} else {{
+        total{n} = total{n} - 1;
+    }}
+    i{n} = i{n} + 1;
+}}
+print(total{n});
+"""
+BROKEN = """int x{n} = ;
+string s{n} = "a" @ 1;
+while (x{n} < ) {{ x{n} = 1; }}
+"""
+
+
+def write_corpus(directory: str):
+    for index in range(FILES):
+        path = os.path.join(directory, f"{index // 100:03d}", f"script_{index}.bl")
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        body = "".join(VALID.format(n=n) for n in range(5))
+        if index % BROKEN_EVERY == 0:
+            body += BROKEN.format(n=index)
+        with open(path, "w") as file_writer:
+            file_writer.write(body)
+
+
+def run():
+    with tempfile.TemporaryDirectory() as directory:
+        write_corpus(directory)
+        print(f"{'jobs':<10} {'files/s':>10} {'failed':>8} {'diagnostics':>12}")
+        for jobs in (1, None):
+            checker = Checker(jobs)
+            start = time.perf_counter()
+            report = checker.check([directory])
+            elapsed = time.perf_counter() - start
+            print(
+                f"{checker.jobs:<10} {report['checked'] / elapsed:10.0f} "
+                f"{report['failed']:8} {len(report['diagnostics']):12}"
+            )
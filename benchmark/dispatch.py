@@ -0,0 +1,62 @@
+import time
+
+from bulang.enums.token_type_enum import TokenType
+from bulang.models.operators.binary_op import BinaryOp
+from bulang.models.operators.unray_op import UnaryOp
+from bulang.models.token import Token
+from bulang.models.types.number import Number
+from bulang.providers.interpreter import Interpreter
+from bulang.providers.lexer import Lexer
+from bulang.providers.parser import Parser
+
+BINARY_OPERATORS = [
+    TokenType.PLUS,
+    TokenType.MINUS,
+    TokenType.MULTIPLY,
+    TokenType.DIVIDE,
+    TokenType.EQUAL,
+    TokenType.NOT_EQUAL,
+    TokenType.LESS_THAN,
+    TokenType.GREATER_THAN,
+    TokenType.LESS_EQUAL,
+    TokenType.GREATER_EQUAL,
+]
+UNARY_OPERATORS = [TokenType.MINUS, TokenType.PLUS]
+
+EXPRESSIONS = 2_000
+EVALUATIONS = 100_000
+
+
+def per_operation(action, count: int) -> float:
+    start = time.perf_counter()
+    action()
+    return (time.perf_counter() - start) / count * 1e9
+
+
+def parse_time(source: str) -> float:
+    tokens = Lexer(source * EXPRESSIONS).tokenize()
+    return per_operation(lambda: Parser(tokens).parse(), EXPRESSIONS)
+
+
+def evaluate_time(node) -> float:
+    interpreter = Interpreter()
+
+    def evaluate():
+        interpret = interpreter.interpret
+        for _ in range(EVALUATIONS):
+            interpret(node)
+
+    return per_operation(evaluate, EVALUATIONS)
+
+
+def run():
+    print(f"{'operator':<10} {'parse ns/expr':>14} {'eval ns/op':>12}")
+    for token_type in BINARY_OPERATORS:
+        node = BinaryOp(Number(7.0), Token(token_type, str(token_type)), Number(3.0))
+        parse = parse_time(f"7 {token_type} 3;\n")
+        print(f"{str(token_type):<10} {parse:14.0f} {evaluate_time(node):12.0f}")
+
+    for token_type in UNARY_OPERATORS:
+        node = UnaryOp(Token(token_type, str(token_type)), Number(7.0))
+        parse = parse_time(f"{token_type}7;\n")
+        print(f"unary {str(token_type):<4} {parse:14.0f} {evaluate_time(node):12.0f}")
@@ -0,0 +1,80 @@
+import io
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from bulang.providers.client import Client
+from bulang.providers.server import Server
+
+SCRIPT = """
+int i = 0;
+int total = 0;
+while (i < 10) {
+    total = total + i;
+    i = i + 1;
+}
+print(total);
+"""
+
+RUNS = 20
+
+
+def measure(label: str, action, runs: int = RUNS):
+    start = time.perf_counter()
+    for _ in range(runs):
+        action()
+    elapsed = (time.perf_counter() - start) / runs
+    print(f"{label:<32} {elapsed * 1000:8.2f} ms/script")
+    return elapsed
+
+
+def run():
+    with tempfile.TemporaryDirectory() as directory:
+        script_path = os.path.join(directory, "script.bl")
+        socket_path = os.path.join(directory, "bulang.sock")
+        with open(script_path, "w") as file_writer:
+            file_writer.write(SCRIPT)
+
+        env = dict(os.environ, BULANG_SOCKET=socket_path)
+        env["PYTHONPATH"] = os.pathsep.join(
+            filter(None, [os.getcwd(), env.get("PYTHONPATH")])
+        )
+
+        def cold():
+            subprocess.run(
+                [sys.executable, "-m", "bulang", script_path],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                check=True,
+            )
+
+        def client_process():
+            subprocess.run(
+                [sys.executable, "-m", "bulang", "client", script_path],
+                env=env,
+                stdout=subprocess.DEVNULL,
+                check=True,
+            )
+
+        client = Client(socket_path)
+
+        def warm():
+            client.run_file(script_path, io.StringIO())
+
+        with Server(socket_path) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                cold_time = measure("cold (python -m bulang)", cold)
+                client_time = measure("client process (warm server)", client_process)
+                measure("in-process client (warm server)", warm)
+            finally:
+                server.shutdown()
+
+    if client_time >= cold_time:
+        print("FAIL: the client process is not faster than a cold run")
+        return False
+    return True
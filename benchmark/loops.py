@@ -0,0 +1,59 @@
+import io
+import time
+
+from bulang import compile_bulang
+from bulang.providers.interpreter import Interpreter
+
+WORKLOADS = {
+    "counting": """
+int i = 0;
+while (i < 200000) {
+    i = i + 1;
+}
+print(i);
+""",
+    "summing": """
+int i = 0;
+int total = 0;
+while (i < 200000) {
+    total = total + i * 2;
+    i = i + 1;
+}
+print(total);
+""",
+    "nested": """
+int i = 0;
+int total = 0;
+while (i < 400) {
+    int j = 0;
+    while (j < 500) {
+        if (j > i) {
+            total = total + 1;
+        }
+        j = j + 1;
+    }
+    i = i + 1;
+}
+print(total);
+""",
+}
+
+
+def execute(program, specialize: bool):
+    output = io.StringIO()
+    start = time.perf_counter()
+    Interpreter(output, specialize=specialize).interpret(program)
+    return time.perf_counter() - start, output.getvalue()
+
+
+def run():
+    print(f"{'workload':<10} {'generic':>10} {'specialized':>12} {'speedup':>8}")
+    for name, source in WORKLOADS.items():
+        program = compile_bulang(source)
+        generic, expected = execute(program, specialize=False)
+        specialized, output = execute(program, specialize=True)
+        assert output == expected, f"{name}: {output!r} != {expected!r}"
+        print(
+            f"{name:<10} {generic:9.3f}s {specialized:11.3f}s "
+            f"{generic / specialized:7.1f}x"
+        )
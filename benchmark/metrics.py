@@ -0,0 +1,53 @@
+import io
+import time
+
+from bulang import compile_bulang, run_bulang
+from bulang.providers.interpreter import Interpreter
+from bulang.providers.metrics import Metrics
+
+DISABLED_OVERHEAD_BUDGET = 0.10
+RUNS = 10
+
+SCRIPT = """
+int i = 0;
+int total = 0;
+while (i < 20000) {
+    int doubled = i * 2;
+    total = total + doubled;
+    i = i + 1;
+}
+print(total);
+"""
+
+
+def best_of(*actions):
+    timings = [[] for _ in actions]
+    for _ in range(RUNS):
+        for action, action_timings in zip(actions, timings):
+            start = time.perf_counter()
+            action()
+            action_timings.append(time.perf_counter() - start)
+    return [min(action_timings) for action_timings in timings]
+
+
+def run() -> bool:
+    def reference():
+        Interpreter(io.StringIO(), specialize=False).interpret(compile_bulang(SCRIPT))
+
+    def disabled():
+        run_bulang(SCRIPT, io.StringIO(), specialize=False)
+
+    def enabled():
+        run_bulang(SCRIPT, io.StringIO(), metrics=Metrics())
+
+    baseline, off, on = best_of(reference, disabled, enabled)
+    overhead = off / baseline - 1
+
+    print(f"{'uninstrumented interpreter':<28} {baseline * 1000:9.2f} ms")
+    print(f"{'metrics disabled':<28} {off * 1000:9.2f} ms ({overhead:+.1%})")
+    print(f"{'metrics enabled':<28} {on * 1000:9.2f} ms ({on / baseline - 1:+.1%})")
+
+    if overhead > DISABLED_OVERHEAD_BUDGET:
+        print(f"Disabled overhead exceeds {DISABLED_OVERHEAD_BUDGET:.0%}")
+        return False
+    return True
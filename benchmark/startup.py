@@ -0,0 +1,93 @@
+import os
+import subprocess
+import sys
+import time
+
+IMPORT_BUDGET_MS = 5.0
+FIRST_OUTPUT_BUDGET_MS = 40.0
+COMPLETION_BUDGET_MS = 40.0
+RUNS = 10
+
+SCRIPT = os.path.join(os.path.dirname(os.path.dirname(__file__)), "hello.bl")
+
+
+def import_time(module: str) -> float:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    for line in result.stderr.splitlines():
+        fields = line.replace(":", "|", 1).split("|")
+        _, _, cumulative, name = (field.strip() for field in fields)
+        if name == module:
+            return int(cumulative) / 1000
+    raise Exception(f"No import time reported for {module}")
+
+
+def first_output_time(arguments, after: bytes = b"") -> float:
+    """Time until the first byte printed after the line ``after``.
+
+    The child runs unbuffered so each byte reaches the pipe when printed;
+    ``python -m bulang`` echoes the script first, so its program output
+    starts after the ``Output:`` line.
+    """
+    start = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-u", *arguments], stdout=subprocess.PIPE
+    )
+    if after:
+        for line in process.stdout:
+            if line.rstrip(b"\n") == after:
+                break
+    process.stdout.read(1)
+    elapsed = time.perf_counter() - start
+    process.stdout.read()
+    process.wait()
+    return elapsed * 1000
+
+
+def completion_time(arguments) -> float:
+    start = time.perf_counter()
+    subprocess.run([sys.executable, *arguments], stdout=subprocess.DEVNULL, check=True)
+    return (time.perf_counter() - start) * 1000
+
+
+def best_of(measure, *args) -> float:
+    return min(measure(*args) for _ in range(RUNS))
+
+
+def report(label: str, value: float, budget: float = None) -> bool:
+    if budget is None:
+        print(f"{label:<36} {value:8.2f} ms")
+        return True
+    status = "ok" if value <= budget else "OVER BUDGET"
+    print(f"{label:<36} {value:8.2f} ms (budget {budget:.2f} ms, {status})")
+    return value <= budget
+
+
+def run() -> bool:
+    ok = report("import bulang", best_of(import_time, "bulang"), IMPORT_BUDGET_MS)
+    report("import bulang.providers.lexer", best_of(import_time, "bulang.providers.lexer"))
+
+    baseline = best_of(first_output_time, ["-c", "print()"])
+    first_output = best_of(first_output_time, ["-m", "bulang", SCRIPT], b"Output:")
+    report("python -c print() first output", baseline)
+    report("python -m bulang first output", first_output)
+    ok = report(
+        "first output overhead",
+        first_output - baseline,
+        FIRST_OUTPUT_BUDGET_MS,
+    ) and ok
+
+    baseline = best_of(completion_time, ["-c", "print()"])
+    completion = best_of(completion_time, ["-m", "bulang", SCRIPT])
+    report("python -c print() completion", baseline)
+    report("python -m bulang completion", completion)
+    ok = report(
+        "completion overhead",
+        completion - baseline,
+        COMPLETION_BUDGET_MS,
+    ) and ok
+    return ok
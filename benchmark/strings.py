@@ -0,0 +1,47 @@
+import io
+import operator
+import time
+
+from bulang import compile_bulang
+from bulang.enums.token_type_enum import TokenType
+from bulang.providers import interpreter
+from bulang.providers.interpreter import Interpreter
+
+LENGTH = 1_000_000
+CHUNK = "x" * 10
+
+SCRIPT = f"""
+string s = "";
+int i = 0;
+while (i < {LENGTH // len(CHUNK)}) {{
+    s = s + "{CHUNK}";
+    i = i + 1;
+}}
+print(s);
+"""
+
+
+def build_time(program) -> float:
+    output = io.StringIO()
+    start = time.perf_counter()
+    Interpreter(output).interpret(program)
+    elapsed = time.perf_counter() - start
+    assert len(output.getvalue()) == LENGTH + 1
+    return elapsed
+
+
+def run():
+    program = compile_bulang(SCRIPT)
+    rope = build_time(program)
+
+    operations = interpreter.BINARY_OPERATIONS
+    add = operations[TokenType.PLUS]
+    operations[TokenType.PLUS] = operator.add
+    try:
+        flat = build_time(program)
+    finally:
+        operations[TokenType.PLUS] = add
+
+    print(f"building a {LENGTH:,}-character string in {LENGTH // len(CHUNK):,} appends")
+    print(f"{'rope':<12} {rope:8.2f} s")
+    print(f"{'flat str':<12} {flat:8.2f} s")
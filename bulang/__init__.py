@@ -1,20 +1,72 @@
-from bulang.providers.interpreter import Interpreter
-from bulang.providers.lexer import Lexer
-from bulang.providers.parser import Parser
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Callable, Optional, TextIO
 
+    from bulang.models.program import Program
+    from bulang.providers.interpreter import Interpreter
+    from bulang.providers.lexer import Lexer
+    from bulang.providers.metrics import Metrics
+    from bulang.providers.parser import Parser
+
+_LAZY_ATTRIBUTES = {
+    "Interpreter": "bulang.providers.interpreter",
+    "Lexer": "bulang.providers.lexer",
+    "Parser": "bulang.providers.parser",
+}
+
+__all__ = ["Interpreter", "Lexer", "Parser", "compile_bulang", "run_bulang"]
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+def compile_bulang(code: str) -> "Program":
+    from bulang.providers.lexer import Lexer
+    from bulang.providers.parser import Parser
+
+    lexer = Lexer(code)
+    tokens = lexer.tokenize()
+
+    parser = Parser(tokens)
+    return parser.parse()
+
+
+def run_bulang(
+    code: str,
+    output: "Optional[TextIO]" = None,
+    interpreter: "Optional[Interpreter]" = None,
+    compiler: "Callable[[str], Program]" = compile_bulang,
+    specialize: "Optional[bool]" = None,
+    metrics: "Optional[Metrics]" = None,
+):
+    if metrics is not None:
+        from bulang.providers.metrics import run_instrumented
+
+        if compiler is not compile_bulang:
+            raise Exception("A custom compiler cannot be used with metrics")
+        return run_instrumented(code, metrics, output, interpreter, bool(specialize))
 
-def run_bulang(code: str):
     try:
-        lexer = Lexer(code)
-        tokens = lexer.tokenize()
+        ast = compiler(code)
 
-        parser = Parser(tokens)
-        ast = parser.parse()
+        if interpreter is None:
+            from bulang.providers.interpreter import Interpreter
 
-        interpreter = Interpreter()
+            interpreter = Interpreter(output, specialize is not False)
         result = interpreter.interpret(ast)
 
         return result
     except Exception as e:
-        print(f"Error: {e}")
+        print(f"Error: {e}", file=output)
         return None
@@ -2,17 +2,132 @@ from bulang import run_bulang
 import sys
 import os
 
+USAGE = """{prog} [--no-specialize] [--metrics <path>] <filename>.bl
+{prog} repl
+{prog} serve [socket]
+{prog} client <filename>.bl | -
+{prog} check [-j <jobs>] <path>..."""
+
+
+def run_file(path: str, specialize: bool = True, metrics_path: str = None):
+    if os.path.isfile(path):
+        with open(path, "r") as file_reader:
+            program = file_reader.read()
+            print("Code:")
+            print(program.strip())
+            print("\nOutput:")
+            if metrics_path:
+                run_with_metrics(program, path, metrics_path)
+            else:
+                run_bulang(program, specialize=specialize)
+            print("-" * 30)
+    else:
+        print(f"File not found: {path}")
+
+
+def run_with_metrics(program: str, path: str, metrics_path: str):
+    from bulang.providers.metrics import Metrics
+    from bulang.providers.metrics_exporter import exporter_for
+
+    metrics = Metrics()
+    run_bulang(program, metrics=metrics)
+    exporter_for(metrics_path).export(metrics, {"script": path})
+
+
+def run(args):
+    specialize = True
+    metrics_path = None
+    while len(args) > 1 and args[0].startswith("--"):
+        if args[0] == "--no-specialize":
+            specialize = False
+            args = args[1:]
+        elif args[0] == "--metrics" and len(args) > 2:
+            metrics_path = args[1]
+            args = args[2:]
+        else:
+            break
+
+    if len(args) != 1:
+        print(USAGE.format(prog=sys.argv[0]))
+        return
+    run_file(args[0], specialize, metrics_path)
+
+
+def repl():
+    from bulang.providers.repl import Repl
+
+    Repl().run()
+
+
+def serve(args):
+    from bulang.providers.client import DEFAULT_SOCKET_PATH
+    from bulang.providers.server import Server
+
+    socket_path = args[0] if args else DEFAULT_SOCKET_PATH
+    try:
+        server = Server(socket_path)
+    except Exception as e:
+        print(f"Error: {e}")
+        sys.exit(1)
+
+    with server:
+        print(f"Listening on {socket_path}")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def client(args):
+    from bulang.providers.client import Client
+
+    if not args:
+        print(USAGE.format(prog=sys.argv[0]))
+        return
+
+    try:
+        if args[0] == "-":
+            Client().run_source(sys.stdin.read())
+        else:
+            Client().run_file(args[0])
+    except OSError as e:
+        print(f"Error: Cannot reach bulang server: {e}")
+        sys.exit(1)
+
+
+def check(args):
+    import json
+
+    from bulang.providers.checker import Checker
+
+    jobs = None
+    if args[:1] == ["-j"]:
+        if len(args) < 2 or not args[1].isdigit() or int(args[1]) < 1:
+            print(USAGE.format(prog=sys.argv[0]))
+            sys.exit(2)
+        jobs, args = int(args[1]), args[2:]
+    if not args:
+        print(USAGE.format(prog=sys.argv[0]))
+        return
+
+    report = Checker(jobs).check(args)
+    print(json.dumps(report, indent=2))
+    if report["failed"]:
+        sys.exit(1)
+
+
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        if os.path.isfile(sys.argv[1]):
-            with open(sys.argv[1], "r") as file_reader:
-                program = file_reader.read()
-                print("Code:")
-                print(program.strip())
-                print("\nOutput:")
-                run_bulang(program)
-                print("-" * 30)
+        command, args = sys.argv[1], sys.argv[2:]
+        if command == "repl":
+            repl()
+        elif command == "serve":
+            serve(args)
+        elif command == "client":
+            client(args)
+        elif command == "check":
+            check(args)
         else:
-            print(f"File not found: {sys.argv[1]}")
+            run(sys.argv[1:])
     else:
-        print(f"{sys.argv[0]} <filename>.bl")
+        print(USAGE.format(prog=sys.argv[0]))
@@ -1,43 +1,52 @@
-from enum import StrEnum
-
-
-class TokenType(StrEnum):
-    NUMBER = "NUMBER"
-    STRING = "STRING"
-    BOOLEAN = "BOOLEAN"
-    IDENTIFIER = "IDENTIFIER"
-
-    INT = "int"
-    STRING_TYPE = "string"
-    BOOLEAN_TYPE = "boolean"
-    IF = "if"
-    ELSE = "else"
-    WHILE = "while"
-    FOR = "for"
-    FUNCTION = "function"
-    RETURN = "return"
-    TRUE = "true"
-    FALSE = "false"
-    PRINT = "print"
-
-    ASSIGN = "="
-    PLUS = "+"
-    MINUS = "-"
-    MULTIPLY = "*"
-    DIVIDE = "/"
-    EQUAL = "=="
-    NOT_EQUAL = "!="
-    LESS_THAN = "<"
-    GREATER_THAN = ">"
-    LESS_EQUAL = "<="
-    GREATER_EQUAL = ">="
-
-    LPAREN = "("
-    RPAREN = ")"
-    LBRACE = "{"
-    RBRACE = "}"
-    SEMICOLON = ";"
-    COMMA = ","
-
-    NEWLINE = "NEWLINE"
-    EOF = "EOF"
+from enum import IntEnum
+
+
+class TokenType(IntEnum):
+    def __new__(cls, code: int, lexeme: str):
+        member = int.__new__(cls, code)
+        member._value_ = code
+        member.lexeme = lexeme
+        return member
+
+    def __str__(self):
+        return self.lexeme
+
+    NUMBER = 0, "NUMBER"
+    STRING = 1, "STRING"
+    BOOLEAN = 2, "BOOLEAN"
+    IDENTIFIER = 3, "IDENTIFIER"
+
+    INT = 4, "int"
+    STRING_TYPE = 5, "string"
+    BOOLEAN_TYPE = 6, "boolean"
+    IF = 7, "if"
+    ELSE = 8, "else"
+    WHILE = 9, "while"
+    FOR = 10, "for"
+    FUNCTION = 11, "function"
+    RETURN = 12, "return"
+    TRUE = 13, "true"
+    FALSE = 14, "false"
+    PRINT = 15, "print"
+
+    ASSIGN = 16, "="
+    PLUS = 17, "+"
+    MINUS = 18, "-"
+    MULTIPLY = 19, "*"
+    DIVIDE = 20, "/"
+    EQUAL = 21, "=="
+    NOT_EQUAL = 22, "!="
+    LESS_THAN = 23, "<"
+    GREATER_THAN = 24, ">"
+    LESS_EQUAL = 25, "<="
+    GREATER_EQUAL = 26, ">="
+
+    LPAREN = 27, "("
+    RPAREN = 28, ")"
+    LBRACE = 29, "{"
+    RBRACE = 30, "}"
+    SEMICOLON = 31, ";"
+    COMMA = 32, ","
+
+    NEWLINE = 33, "NEWLINE"
+    EOF = 34, "EOF"
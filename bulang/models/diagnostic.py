@@ -0,0 +1,26 @@
+class Diagnostic:
+    def __init__(self, stage: str, message: str, line: int, column: int = 0):
+        self.stage = stage
+        self.message = message
+        self.line = line
+        self.column = column
+
+    def to_dict(self) -> dict:
+        return {
+            "stage": self.stage,
+            "line": self.line,
+            "column": self.column,
+            "message": self.message,
+        }
+
+    def __str__(self):
+        return f"{self.stage} error at line {self.line}: {self.message}"
+
+    def __repr__(self):
+        return f"Diagnostic({self.stage}, {self.line}:{self.column}, {self.message})"
+
+
+class DiagnosticError(Exception):
+    def __init__(self, diagnostic: Diagnostic):
+        super().__init__(str(diagnostic))
+        self.diagnostic = diagnostic
@@ -0,0 +1,116 @@
+from typing import Any, Optional, Union
+
+FLAT_LIMIT = 64
+
+
+class Rope:
+    """String value built by concatenation and flattened on first read.
+
+    Each rope points at the rope it extends and holds only the appended
+    chunk, so every concatenation is O(1) and branches share their prefix.
+    Flattening joins the chain once and then keeps only the joined text.
+    """
+
+    __slots__ = ("parent", "chunk", "length")
+
+    def __init__(self, parent: Optional["Rope"], chunk: str, length: int):
+        self.parent = parent
+        self.chunk = chunk
+        self.length = length
+
+    @classmethod
+    def concat(cls, left: Union[str, "Rope"], right: Union[str, "Rope"]):
+        if type(right) is Rope:
+            right = str(right)
+
+        if type(left) is not Rope:
+            if len(left) + len(right) < FLAT_LIMIT:
+                return left + right
+            left = cls(None, left, len(left))
+
+        return cls(left, right, left.length + len(right))
+
+    def __str__(self) -> str:
+        if self.parent is None:
+            return self.chunk
+
+        chunks = []
+        rope = self
+        while rope is not None:
+            chunks.append(rope.chunk)
+            rope = rope.parent
+        chunks.reverse()
+
+        self.chunk = "".join(chunks)
+        self.parent = None
+        return self.chunk
+
+    def __repr__(self):
+        return repr(str(self))
+
+    def __len__(self) -> int:
+        return self.length
+
+    def __bool__(self) -> bool:
+        return self.length > 0
+
+    def __hash__(self) -> int:
+        return hash(str(self))
+
+    def __eq__(self, other: Any) -> bool:
+        return str(self) == flatten(other)
+
+    def __ne__(self, other: Any) -> bool:
+        return str(self) != flatten(other)
+
+    def __lt__(self, other: Any) -> bool:
+        return str(self) < flatten(other)
+
+    def __gt__(self, other: Any) -> bool:
+        return str(self) > flatten(other)
+
+    def __le__(self, other: Any) -> bool:
+        return str(self) <= flatten(other)
+
+    def __ge__(self, other: Any) -> bool:
+        return str(self) >= flatten(other)
+
+    def __add__(self, other: Any) -> Any:
+        if isinstance(other, (str, Rope)):
+            return Rope.concat(self, other)
+        return str(self) + other
+
+    def __radd__(self, other: Any) -> Any:
+        if isinstance(other, str):
+            return Rope.concat(other, self)
+        return other + str(self)
+
+    def __sub__(self, other: Any) -> Any:
+        return str(self) - flatten(other)
+
+    def __rsub__(self, other: Any) -> Any:
+        return other - str(self)
+
+    def __mul__(self, other: Any) -> Any:
+        return str(self) * flatten(other)
+
+    def __rmul__(self, other: Any) -> Any:
+        return other * str(self)
+
+    def __truediv__(self, other: Any) -> Any:
+        return str(self) / flatten(other)
+
+    def __rtruediv__(self, other: Any) -> Any:
+        return other / str(self)
+
+    def __neg__(self) -> Any:
+        return -str(self)
+
+    def __pos__(self) -> Any:
+        return +str(self)
+
+
+def flatten(value: Any) -> Any:
+    if type(value) is Rope:
+        return str(value)
+    return value
@@ -0,0 +1,84 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, Optional, Tuple
+
+from bulang.models.diagnostic import Diagnostic
+from bulang.models.program import Program
+from bulang.providers.lexer import Lexer
+from bulang.providers.parser import Parser
+
+SOURCE_EXTENSION = ".bl"
+SERIAL_LIMIT = 64
+
+
+def check_source(code: str) -> Tuple[Program, List[Diagnostic]]:
+    lexer = Lexer(code, recover=True)
+    tokens = lexer.tokenize()
+
+    parser = Parser(tokens, recover=True)
+    program = parser.parse()
+
+    diagnostics = sorted(
+        lexer.diagnostics + parser.diagnostics,
+        key=lambda diagnostic: (diagnostic.line, diagnostic.column),
+    )
+    return program, diagnostics
+
+
+def check_file(path: str) -> List[dict]:
+    try:
+        with open(path, "r") as file_reader:
+            code = file_reader.read()
+    except (OSError, UnicodeDecodeError) as e:
+        diagnostics = [Diagnostic("File", str(e), 0)]
+    else:
+        try:
+            _, diagnostics = check_source(code)
+        except RecursionError:
+            diagnostics = [Diagnostic("Parser", "Maximum nesting depth exceeded", 0)]
+        except Exception as e:
+            diagnostics = [Diagnostic("Internal", str(e), 0)]
+
+    return [{"path": path, **diagnostic.to_dict()} for diagnostic in diagnostics]
+
+
+class Checker:
+    def __init__(self, jobs: Optional[int] = None):
+        self.jobs = jobs or os.cpu_count() or 1
+
+    def collect(self, paths: Iterable[str]) -> List[str]:
+        files = []
+        for path in paths:
+            if os.path.isdir(path):
+                for root, _, names in os.walk(path):
+                    files.extend(
+                        os.path.join(root, name)
+                        for name in names
+                        if name.endswith(SOURCE_EXTENSION)
+                    )
+            else:
+                files.append(path)
+        return sorted(files)
+
+    def check(self, paths: Iterable[str]) -> dict:
+        files = self.collect(paths)
+
+        if self.jobs == 1 or len(files) < SERIAL_LIMIT:
+            results = map(check_file, files)
+        else:
+            chunksize = max(1, len(files) // (self.jobs * 8))
+            with ProcessPoolExecutor(self.jobs) as executor:
+                results = list(executor.map(check_file, files, chunksize=chunksize))
+
+        diagnostics = []
+        failed = 0
+        for file_diagnostics in results:
+            if file_diagnostics:
+                failed += 1
+                diagnostics.extend(file_diagnostics)
+
+        return {
+            "checked": len(files),
+            "failed": failed,
+            "diagnostics": diagnostics,
+        }
@@ -0,0 +1,45 @@
+import os
+import socket
+import sys
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Optional, TextIO
+
+DEFAULT_SOCKET_PATH = os.environ.get(
+    "BULANG_SOCKET",
+    os.path.join(os.environ.get("TMPDIR", "/tmp"), f"bulang-{os.getuid()}.sock"),
+)
+
+
+class Client:
+    """Sends a program to a bulang server and copies its output.
+
+    A request is one header line, either ``path <absolute path>`` or
+    ``source``, followed by the program text when the header is ``source``.
+    The client keeps to the standard library modules the interpreter
+    already loads at startup, so it starts faster than a cold run.
+    """
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH):
+        self.socket_path = socket_path
+
+    def send(self, request: bytes, output: "Optional[TextIO]" = None):
+        output = output or sys.stdout
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(self.socket_path)
+            sock.sendall(request)
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile("r", encoding="utf-8") as reader:
+                for line in reader:
+                    output.write(line)
+        output.flush()
+
+    def run_file(self, path: str, output: "Optional[TextIO]" = None):
+        path = os.path.abspath(path)
+        if "\n" in path:
+            raise OSError(f"Cannot send a path containing a newline: {path!r}")
+        self.send(f"path {path}\n".encode("utf-8"), output)
+
+    def run_source(self, source: str, output: "Optional[TextIO]" = None):
+        self.send(b"source\n" + source.encode("utf-8"), output)
@@ -1,30 +1,87 @@
-from typing import Any
+from __future__ import annotations
+
+import operator
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, TextIO
 from bulang.enums.token_type_enum import TokenType
-from bulang.models.ast_node import ASTNode
-from bulang.models.block import Block
-from bulang.models.operators.assignment import Assignment
-from bulang.models.operators.binary_op import BinaryOp
-from bulang.models.operators.identifier import Identifier
-from bulang.models.operators.unray_op import UnaryOp
-from bulang.models.program import Program
-from bulang.models.statements.if_statement import IfStatement
-from bulang.models.statements.print_statement import PrintStatement
-from bulang.models.statements.while_statement import WhileStatement
-from bulang.models.types.boolean import Boolean
-from bulang.models.types.number import Number
-from bulang.models.types.string import String
-from bulang.models.var_declaration import VarDeclaration
+from bulang.models.rope import Rope, flatten
 from bulang.providers.environment import Environment
 
+if TYPE_CHECKING:
+    from bulang.models.ast_node import ASTNode
+    from bulang.models.block import Block
+    from bulang.models.operators.assignment import Assignment
+    from bulang.models.operators.binary_op import BinaryOp
+    from bulang.models.operators.identifier import Identifier
+    from bulang.models.operators.unray_op import UnaryOp
+    from bulang.models.program import Program
+    from bulang.models.statements.if_statement import IfStatement
+    from bulang.models.statements.print_statement import PrintStatement
+    from bulang.models.statements.while_statement import WhileStatement
+    from bulang.models.types.boolean import Boolean
+    from bulang.models.types.number import Number
+    from bulang.models.types.string import String
+    from bulang.models.var_declaration import VarDeclaration
+
+
+def add(left: Any, right: Any) -> Any:
+    if type(left) is str and type(right) is str:
+        return Rope.concat(left, right)
+    return left + right
+
+
+def divide(left: Any, right: Any) -> Any:
+    if right == 0:
+        raise Exception("Division by zero")
+    return left / right
+
+
+def operator_table(operations: Dict[TokenType, Callable]) -> List[Optional[Callable]]:
+    table: List[Optional[Callable]] = [None] * len(TokenType)
+    for token_type, operation in operations.items():
+        table[token_type] = operation
+    return table
+
+
+BINARY_OPERATIONS = operator_table(
+    {
+        TokenType.PLUS: add,
+        TokenType.MINUS: operator.sub,
+        TokenType.MULTIPLY: operator.mul,
+        TokenType.DIVIDE: divide,
+        TokenType.EQUAL: operator.eq,
+        TokenType.NOT_EQUAL: operator.ne,
+        TokenType.LESS_THAN: operator.lt,
+        TokenType.GREATER_THAN: operator.gt,
+        TokenType.LESS_EQUAL: operator.le,
+        TokenType.GREATER_EQUAL: operator.ge,
+    }
+)
+UNARY_OPERATIONS = operator_table(
+    {
+        TokenType.MINUS: operator.neg,
+        TokenType.PLUS: operator.pos,
+    }
+)
+
 
 class Interpreter:
-    def __init__(self):
+    def __init__(self, output: Optional[TextIO] = None, specialize: bool = True):
         self.global_env = Environment()
         self.environment = self.global_env
+        self.output = output
+        self.specializer = None
+        if specialize:
+            from bulang.providers.specializer import LoopSpecializer
+
+            self.specializer = LoopSpecializer(output)
+        self.visitors: Dict[type, Callable[[ASTNode], Any]] = {}
 
     def interpret(self, node: ASTNode) -> Any:
-        method_name = f"visit_{type(node).__name__}"
-        visitor = getattr(self, method_name, self.generic_visit)
+        visitor = self.visitors.get(type(node))
+        if visitor is None:
+            method_name = f"visit_{type(node).__name__}"
+            visitor = getattr(self, method_name, self.generic_visit)
+            self.visitors[type(node)] = visitor
         return visitor(node)
 
     def generic_visit(self, node: ASTNode):
@@ -34,7 +91,7 @@ class Interpreter:
         result = None
         for statement in node.statements:
             result = self.interpret(statement)
-        return result
+        return flatten(result)
 
     def visit_VarDeclaration(self, node: VarDeclaration) -> Any:
         value = None
@@ -60,38 +117,18 @@ class Interpreter:
         left = self.interpret(node.left)
         right = self.interpret(node.right)
 
-        if node.operator.type == TokenType.PLUS:
-            return left + right
-        elif node.operator.type == TokenType.MINUS:
-            return left - right
-        elif node.operator.type == TokenType.MULTIPLY:
-            return left * right
-        elif node.operator.type == TokenType.DIVIDE:
-            if right == 0:
-                raise Exception("Division by zero")
-            return left / right
-        elif node.operator.type == TokenType.EQUAL:
-            return left == right
-        elif node.operator.type == TokenType.NOT_EQUAL:
-            return left != right
-        elif node.operator.type == TokenType.LESS_THAN:
-            return left < right
-        elif node.operator.type == TokenType.GREATER_THAN:
-            return left > right
-        elif node.operator.type == TokenType.LESS_EQUAL:
-            return left <= right
-        elif node.operator.type == TokenType.GREATER_EQUAL:
-            return left >= right
+        operation = BINARY_OPERATIONS[node.operator.type]
+        if operation is not None:
+            return operation(left, right)
 
         raise Exception(f"Unknown binary operator: {node.operator.type}")
 
     def visit_UnaryOp(self, node: UnaryOp) -> Any:
         operand = self.interpret(node.operand)
 
-        if node.operator.type == TokenType.MINUS:
-            return -operand
-        elif node.operator.type == TokenType.PLUS:
-            return +operand
+        operation = UNARY_OPERATIONS[node.operator.type]
+        if operation is not None:
+            return operation(operand)
 
         raise Exception(f"Unknown unary operator: {node.operator.type}")
 
@@ -119,9 +156,15 @@ class Interpreter:
 
     def visit_WhileStatement(self, node: WhileStatement) -> Any:
         result = None
-        while self.is_truthy(self.interpret(node.condition)):
+        specializer = self.specializer
+        while True:
+            if specializer is not None:
+                done, result = specializer.run(node, self.environment, result)
+                if done:
+                    return result
+            if not self.is_truthy(self.interpret(node.condition)):
+                return result
             result = self.interpret(node.body)
-        return result
 
     def visit_Block(self, node: Block) -> Any:
         previous = self.environment
@@ -137,12 +180,10 @@ class Interpreter:
 
     def visit_PrintStatement(self, node: PrintStatement) -> Any:
         value = self.interpret(node.expression)
-        print(value)
+        print(value, file=self.output)
         return value
 
     def is_truthy(self, value: Any) -> bool:
-        if value is None or value is False:
-            return False
-        if value == 0 or value == "":
-            return False
-        return True
+        # None, false, 0 and "" are the only falsy values, which matches bool()
+        # for every runtime type without comparing across types.
+        return bool(value)
@@ -1,18 +1,44 @@
 from typing import List
 
 from bulang.enums.token_type_enum import TokenType
+from bulang.models.diagnostic import Diagnostic, DiagnosticError
 from bulang.models.token import Token
 
+KEYWORDS = {
+    "int": TokenType.INT,
+    "string": TokenType.STRING_TYPE,
+    "boolean": TokenType.BOOLEAN_TYPE,
+    "if": TokenType.IF,
+    "else": TokenType.ELSE,
+    "while": TokenType.WHILE,
+    "for": TokenType.FOR,
+    "function": TokenType.FUNCTION,
+    "return": TokenType.RETURN,
+    "true": TokenType.TRUE,
+    "false": TokenType.FALSE,
+    "print": TokenType.PRINT,
+}
+BOOLEAN_LITERALS = frozenset({TokenType.TRUE, TokenType.FALSE})
+
 
 class Lexer:
-    def __init__(self, text: str):
+    def __init__(self, text: str, recover: bool = False):
         self.text = text
         self.pos = 0
         self.line = 1
+        self.line_start = 0
         self.tokens = []
+        self.recover = recover
+        self.diagnostics: List[Diagnostic] = []
 
     def error(self, message: str):
-        raise Exception(f"Lexer error at line {self.line}: {message}")
+        diagnostic = Diagnostic("Lexer", message, self.line, self.column())
+        if not self.recover:
+            raise DiagnosticError(diagnostic)
+        self.diagnostics.append(diagnostic)
+
+    def column(self) -> int:
+        return self.pos - self.line_start + 1
 
     def peek(self, offset: int = 0) -> str:
         pos = self.pos + offset
@@ -27,6 +53,7 @@ class Lexer:
         self.pos += 1
         if char == "\n":
             self.line += 1
+            self.line_start = self.pos
         return char
 
     def skip_whitespace(self):
@@ -55,21 +82,6 @@ class Lexer:
         return result
 
     def tokenize(self) -> List[Token]:
-        keywords = {
-            "int": TokenType.INT,
-            "string": TokenType.STRING_TYPE,
-            "boolean": TokenType.BOOLEAN_TYPE,
-            "if": TokenType.IF,
-            "else": TokenType.ELSE,
-            "while": TokenType.WHILE,
-            "for": TokenType.FOR,
-            "function": TokenType.FUNCTION,
-            "return": TokenType.RETURN,
-            "true": TokenType.TRUE,
-            "false": TokenType.FALSE,
-            "print": TokenType.PRINT,
-        }
-
         while self.pos < len(self.text):
             self.skip_whitespace()
 
@@ -77,82 +89,84 @@ class Lexer:
                 break
 
             char = self.peek()
+            line, column = self.line, self.column()
 
             if char == "\n":
-                self.tokens.append(Token(TokenType.NEWLINE, char, self.line))
+                self.tokens.append(Token(TokenType.NEWLINE, char, line, column))
                 self.advance()
             elif char.isdigit():
                 self.tokens.append(
-                    Token(TokenType.NUMBER, self.read_number(), self.line)
+                    Token(TokenType.NUMBER, self.read_number(), line, column)
                 )
             elif char == '"':
                 self.tokens.append(
-                    Token(TokenType.STRING, self.read_string(), self.line)
+                    Token(TokenType.STRING, self.read_string(), line, column)
                 )
             elif char.isalpha() or char == "_":
                 identifier = self.read_identifier()
-                token_type = keywords.get(identifier, TokenType.IDENTIFIER)
-                if token_type in [TokenType.TRUE, TokenType.FALSE]:
+                token_type = KEYWORDS.get(identifier, TokenType.IDENTIFIER)
+                if token_type in BOOLEAN_LITERALS:
                     token_type = TokenType.BOOLEAN
-                self.tokens.append(Token(token_type, identifier, self.line))
+                self.tokens.append(Token(token_type, identifier, line, column))
             elif char == "=":
                 self.advance()
                 if self.peek() == "=":
                     self.advance()
-                    self.tokens.append(Token(TokenType.EQUAL, "==", self.line))
+                    self.tokens.append(Token(TokenType.EQUAL, "==", line, column))
                 else:
-                    self.tokens.append(Token(TokenType.ASSIGN, "=", self.line))
+                    self.tokens.append(Token(TokenType.ASSIGN, "=", line, column))
             elif char == "!":
                 self.advance()
                 if self.peek() == "=":
                     self.advance()
-                    self.tokens.append(Token(TokenType.NOT_EQUAL, "!=", self.line))
+                    self.tokens.append(Token(TokenType.NOT_EQUAL, "!=", line, column))
             elif char == "<":
                 self.advance()
                 if self.peek() == "=":
                     self.advance()
-                    self.tokens.append(Token(TokenType.LESS_EQUAL, "<=", self.line))
+                    self.tokens.append(Token(TokenType.LESS_EQUAL, "<=", line, column))
                 else:
-                    self.tokens.append(Token(TokenType.LESS_THAN, "<", self.line))
+                    self.tokens.append(Token(TokenType.LESS_THAN, "<", line, column))
             elif char == ">":
                 self.advance()
                 if self.peek() == "=":
                     self.advance()
-                    self.tokens.append(Token(TokenType.GREATER_EQUAL, ">=", self.line))
+                    self.tokens.append(Token(TokenType.GREATER_EQUAL, ">=", line, column))
                 else:
-                    self.tokens.append(Token(TokenType.GREATER_THAN, ">", self.line))
+                    self.tokens.append(Token(TokenType.GREATER_THAN, ">", line, column))
             elif char == "+":
-                self.tokens.append(Token(TokenType.PLUS, char, self.line))
+                self.tokens.append(Token(TokenType.PLUS, char, line, column))
                 self.advance()
             elif char == "-":
-                self.tokens.append(Token(TokenType.MINUS, char, self.line))
+                self.tokens.append(Token(TokenType.MINUS, char, line, column))
                 self.advance()
             elif char == "*":
-                self.tokens.append(Token(TokenType.MULTIPLY, char, self.line))
+                self.tokens.append(Token(TokenType.MULTIPLY, char, line, column))
                 self.advance()
             elif char == "/":
-                self.tokens.append(Token(TokenType.DIVIDE, char, self.line))
+                self.tokens.append(Token(TokenType.DIVIDE, char, line, column))
                 self.advance()
             elif char == "(":
-                self.tokens.append(Token(TokenType.LPAREN, char, self.line))
+                self.tokens.append(Token(TokenType.LPAREN, char, line, column))
                 self.advance()
             elif char == ")":
-                self.tokens.append(Token(TokenType.RPAREN, char, self.line))
+                self.tokens.append(Token(TokenType.RPAREN, char, line, column))
                 self.advance()
             elif char == "{":
-                self.tokens.append(Token(TokenType.LBRACE, char, self.line))
+                self.tokens.append(Token(TokenType.LBRACE, char, line, column))
                 self.advance()
             elif char == "}":
-                self.tokens.append(Token(TokenType.RBRACE, char, self.line))
+                self.tokens.append(Token(TokenType.RBRACE, char, line, column))
                 self.advance()
             elif char == ";":
-                self.tokens.append(Token(TokenType.SEMICOLON, char, self.line))
+                self.tokens.append(Token(TokenType.SEMICOLON, char, line, column))
                 self.advance()
             elif char == ",":
-                self.tokens.append(Token(TokenType.COMMA, char, self.line))
+                self.tokens.append(Token(TokenType.COMMA, char, line, column))
                 self.advance()
             else:
                 self.error(f"Unexpected character: {char}")
+                self.advance()
 
-        self.tokens.append(Token(TokenType.EOF, "", self.line))
+        self.tokens.append(Token(TokenType.EOF, "", self.line, self.column()))
         return self.tokens
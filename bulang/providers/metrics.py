@@ -0,0 +1,215 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, Optional, TextIO
+
+from bulang.models.ast_node import ASTNode
+from bulang.models.block import Block
+from bulang.models.program import Program
+from bulang.models.rope import flatten
+from bulang.models.statements.if_statement import IfStatement
+from bulang.models.statements.while_statement import WhileStatement
+from bulang.providers.environment import Environment
+from bulang.providers.interpreter import Interpreter
+from bulang.providers.lexer import Lexer
+from bulang.providers.parser import Parser
+
+STAGES = ("lex", "parse", "execute")
+COUNTERS = (
+    "statements_executed",
+    "nodes_visited",
+    "frames_created",
+    "variable_lookups",
+    "parent_chain_walks",
+    "max_parent_chain_depth",
+)
+EVENTS = ("stage", "node", "frame", "lookup")
+
+
+class Metrics:
+    """Per-script timers and counters collected by an InstrumentedInterpreter.
+
+    Callbacks subscribed to an event are called as the script runs:
+    ``stage(name, seconds)``, ``node(node)``, ``frame(environment)`` and
+    ``lookup(name, depth)``.
+    """
+
+    def __init__(self):
+        self.timers: Dict[str, float] = {stage: 0.0 for stage in STAGES}
+        self.counters: Dict[str, int] = {counter: 0 for counter in COUNTERS}
+        self.listeners: Dict[str, List[Callable]] = {event: [] for event in EVENTS}
+        self.error: Optional[str] = None
+
+    def subscribe(self, event: str, callback: Callable):
+        if event not in self.listeners:
+            raise Exception(f"Unknown metrics event: {event}")
+        self.listeners[event].append(callback)
+
+    def emit(self, event: str, *args: Any):
+        for callback in self.listeners[event]:
+            callback(*args)
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.timers[name] = self.timers.get(name, 0.0) + elapsed
+            self.emit("stage", name, elapsed)
+
+    def record_lookup(self, name: str, depth: int):
+        counters = self.counters
+        counters["variable_lookups"] += 1
+        counters["parent_chain_walks"] += depth
+        if depth > counters["max_parent_chain_depth"]:
+            counters["max_parent_chain_depth"] = depth
+        if self.listeners["lookup"]:
+            self.emit("lookup", name, depth)
+
+    def snapshot(self) -> dict:
+        return {
+            "timers": {f"{stage}_seconds": value for stage, value in self.timers.items()},
+            "counters": dict(self.counters),
+            "error": self.error,
+        }
+
+
+class InstrumentedEnvironment(Environment):
+    def __init__(
+        self,
+        parent: Optional["InstrumentedEnvironment"] = None,
+        metrics: Optional[Metrics] = None,
+    ):
+        super().__init__(parent)
+        self.metrics = metrics if metrics is not None else parent.metrics
+        self.metrics.counters["frames_created"] += 1
+        if self.metrics.listeners["frame"]:
+            self.metrics.emit("frame", self)
+
+    def resolve(self, name: str) -> Environment:
+        environment = self
+        depth = 0
+        while name not in environment.variables:
+            environment = environment.parent
+            if environment is None:
+                self.metrics.record_lookup(name, depth)
+                raise Exception(f"Undefined variable: {name}")
+            depth += 1
+        self.metrics.record_lookup(name, depth)
+        return environment
+
+    def get(self, name: str) -> Any:
+        return self.resolve(name).variables[name]
+
+    def assign(self, name: str, value: Any):
+        self.resolve(name).variables[name] = value
+
+
+class InstrumentedInterpreter(Interpreter):
+    """Interpreter that reports into a Metrics instance.
+
+    Loop specialization is off by default so that every statement and
+    lookup inside hot loops is counted. Statements are counted where they
+    are run (program and block bodies, branches and loop bodies), so
+    expression statements such as ``x + 1;`` are included.
+    """
+
+    def __init__(
+        self,
+        metrics: Metrics,
+        output: Optional[TextIO] = None,
+        specialize: bool = False,
+    ):
+        super().__init__(output, specialize)
+        self.metrics = metrics
+        self.global_env = InstrumentedEnvironment(metrics=metrics)
+        self.environment = self.global_env
+
+    def interpret(self, node: ASTNode) -> Any:
+        metrics = self.metrics
+        counters = metrics.counters
+        counters["nodes_visited"] += 1
+        if metrics.listeners["node"]:
+            metrics.emit("node", node)
+        return super().interpret(node)
+
+    def execute(self, statement: ASTNode) -> Any:
+        self.metrics.counters["statements_executed"] += 1
+        return self.interpret(statement)
+
+    def visit_Program(self, node: Program) -> Any:
+        result = None
+        for statement in node.statements:
+            result = self.execute(statement)
+        return flatten(result)
+
+    def visit_IfStatement(self, node: IfStatement) -> Any:
+        condition = self.interpret(node.condition)
+
+        if self.is_truthy(condition):
+            return self.execute(node.then_branch)
+        elif node.else_branch:
+            return self.execute(node.else_branch)
+
+        return None
+
+    def visit_WhileStatement(self, node: WhileStatement) -> Any:
+        result = None
+        specializer = self.specializer
+        while True:
+            if specializer is not None:
+                done, result = specializer.run(node, self.environment, result)
+                if done:
+                    return result
+            if not self.is_truthy(self.interpret(node.condition)):
+                return result
+            result = self.execute(node.body)
+
+    def visit_Block(self, node: Block) -> Any:
+        previous = self.environment
+        self.environment = InstrumentedEnvironment(previous)
+
+        try:
+            result = None
+            for statement in node.statements:
+                result = self.execute(statement)
+            return result
+        finally:
+            self.environment = previous
+
+
+def run_instrumented(
+    code: str,
+    metrics: Metrics,
+    output: Optional[TextIO] = None,
+    interpreter: Optional[InstrumentedInterpreter] = None,
+    specialize: bool = False,
+):
+    """Runs code like run_bulang while recording into metrics.
+
+    Lexing and parsing are timed as separate stages, so a custom compiler
+    cannot be used. A failed run is recorded in ``metrics.error``.
+    """
+    if interpreter is not None and not (
+        isinstance(interpreter, InstrumentedInterpreter) and interpreter.metrics is metrics
+    ):
+        raise Exception("Metrics require an InstrumentedInterpreter using the same Metrics")
+
+    try:
+        with metrics.stage("lex"):
+            tokens = Lexer(code).tokenize()
+
+        with metrics.stage("parse"):
+            ast = Parser(tokens).parse()
+
+        if interpreter is None:
+            interpreter = InstrumentedInterpreter(metrics, output, specialize)
+        with metrics.stage("execute"):
+            result = interpreter.interpret(ast)
+
+        return result
+    except Exception as e:
+        metrics.error = str(e)
+        print(f"Error: {e}", file=output)
+        return None
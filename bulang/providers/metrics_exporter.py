@@ -0,0 +1,142 @@
+import fcntl
+import json
+import os
+import re
+import time
+from typing import Dict, Optional, Tuple
+
+from bulang.providers.metrics import Metrics
+
+PROMETHEUS_EXTENSION = ".prom"
+SAMPLE_PATTERN = re.compile(r"^(\w+)(?:\{(.*)\})? (\S+)$")
+LABEL_PATTERN = re.compile(r'(\w+)="((?:[^"\\]|\\.)*)"')
+
+LabelSet = Tuple[Tuple[str, str], ...]
+
+
+class JsonLinesExporter:
+    def __init__(self, path: str):
+        self.path = path
+
+    def export(self, metrics: Metrics, labels: Optional[Dict[str, str]] = None):
+        record = {"timestamp": time.time(), "labels": labels or {}}
+        record.update(metrics.snapshot())
+        with open(self.path, "a") as file_writer:
+            file_writer.write(json.dumps(record) + "\n")
+
+
+class PrometheusExporter:
+    """Writes a Prometheus text file with the latest metrics per label set.
+
+    Each export merges into the series already in the file, so separate
+    runs that share a file keep each other's scripts. The file is locked
+    while it is merged and replaced atomically, so a textfile collector
+    never reads a partial write.
+    """
+
+    def __init__(self, path: str, prefix: str = "bulang"):
+        self.path = path
+        self.prefix = prefix
+
+    def export(self, metrics: Metrics, labels: Optional[Dict[str, str]] = None):
+        # Labels read back from the file are strings, so {"run": 1} must
+        # merge with the series it wrote last time.
+        key = tuple(
+            sorted((str(name), str(value)) for name, value in (labels or {}).items())
+        )
+
+        with open(f"{self.path}.lock", "w") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            records = self.read()
+            records[key] = metrics.snapshot()
+
+            temporary_path = f"{self.path}.{os.getpid()}.tmp"
+            with open(temporary_path, "w") as file_writer:
+                file_writer.write(self.render(records))
+            os.replace(temporary_path, self.path)
+
+    def read(self) -> Dict[LabelSet, dict]:
+        records: Dict[LabelSet, dict] = {}
+        try:
+            with open(self.path, "r") as file_reader:
+                lines = file_reader.read().splitlines()
+        except FileNotFoundError:
+            return records
+
+        prefix = f"{self.prefix}_"
+        for line in lines:
+            match = SAMPLE_PATTERN.match(line)
+            if not match or not match.group(1).startswith(prefix):
+                continue
+            name = match.group(1)[len(prefix):]
+            labels = {
+                key: unescape(value)
+                for key, value in LABEL_PATTERN.findall(match.group(2) or "")
+            }
+            stage = labels.pop("stage", None) if name == "stage_seconds" else None
+            record = records.setdefault(
+                tuple(sorted(labels.items())),
+                {"timers": {}, "counters": {}, "error": None},
+            )
+
+            value = float(match.group(3))
+            if stage is not None:
+                record["timers"][f"{stage}_seconds"] = value
+            elif name == "run_failed":
+                record["error"] = "failed" if value else None
+            else:
+                record["counters"][name] = int(value)
+        return records
+
+    def render(self, records: Dict[LabelSet, dict]) -> str:
+        name = f"{self.prefix}_stage_seconds"
+        lines = [
+            f"# HELP {name} Time spent in each stage of the last run.",
+            f"# TYPE {name} gauge",
+        ]
+        for key, snapshot in records.items():
+            for timer, value in snapshot["timers"].items():
+                stage = timer[: -len("_seconds")]
+                lines.append(f"{name}{self.labels(key + (('stage', stage),))} {value}")
+
+        name = f"{self.prefix}_run_failed"
+        lines.append(f"# HELP {name} 1 if the last run ended with an error.")
+        lines.append(f"# TYPE {name} gauge")
+        for key, snapshot in records.items():
+            lines.append(f"{name}{self.labels(key)} {1 if snapshot['error'] else 0}")
+
+        counters = []
+        for snapshot in records.values():
+            counters.extend(
+                counter for counter in snapshot["counters"] if counter not in counters
+            )
+        for counter in counters:
+            name = f"{self.prefix}_{counter}"
+            lines.append(f"# TYPE {name} gauge")
+            for key, snapshot in records.items():
+                if counter in snapshot["counters"]:
+                    lines.append(f"{name}{self.labels(key)} {snapshot['counters'][counter]}")
+
+        return "\n".join(lines) + "\n"
+
+    def labels(self, items: LabelSet) -> str:
+        if not items:
+            return ""
+        pairs = ",".join(f'{key}="{escape(str(value))}"' for key, value in items)
+        return "{" + pairs + "}"
+
+
+def escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def unescape(value: str) -> str:
+    return re.sub(
+        r"\\(.)", lambda match: "\n" if match.group(1) == "n" else match.group(1), value
+    )
+
+
+def exporter_for(path: str):
+    if path.endswith(PROMETHEUS_EXTENSION):
+        return PrometheusExporter(path)
+    return JsonLinesExporter(path)
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import FrozenSet, List, Optional
 from bulang.enums.token_type_enum import TokenType
 from bulang.models.ast_node import ASTNode
 from bulang.models.block import Block
+from bulang.models.diagnostic import Diagnostic, DiagnosticError
 from bulang.models.operators.assignment import Assignment
 from bulang.models.operators.binary_op import BinaryOp
 from bulang.models.operators.identifier import Identifier
@@ -16,15 +17,65 @@ from bulang.models.types.number import Number
 from bulang.models.types.string import String
 from bulang.models.var_declaration import VarDeclaration
 
+DECLARATION_TYPES = frozenset(
+    {TokenType.INT, TokenType.STRING_TYPE, TokenType.BOOLEAN_TYPE}
+)
+EQUALITY_OPERATORS = frozenset({TokenType.EQUAL, TokenType.NOT_EQUAL})
+COMPARISON_OPERATORS = frozenset(
+    {
+        TokenType.GREATER_THAN,
+        TokenType.GREATER_EQUAL,
+        TokenType.LESS_THAN,
+        TokenType.LESS_EQUAL,
+    }
+)
+TERM_OPERATORS = frozenset({TokenType.PLUS, TokenType.MINUS})
+FACTOR_OPERATORS = frozenset({TokenType.MULTIPLY, TokenType.DIVIDE})
+UNARY_OPERATORS = frozenset({TokenType.MINUS, TokenType.PLUS})
+BLOCK_TERMINATORS = frozenset({TokenType.RBRACE, TokenType.EOF})
+
 
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: List[Token], recover: bool = False):
         self.tokens = tokens
         self.pos = 0
+        self.recover = recover
+        self.diagnostics: List[Diagnostic] = []
+        self.block_depth = 0
+        self.statement_parsers = {
+            TokenType.INT: self.var_declaration,
+            TokenType.STRING_TYPE: self.var_declaration,
+            TokenType.BOOLEAN_TYPE: self.var_declaration,
+            TokenType.IF: self.if_statement,
+            TokenType.WHILE: self.while_statement,
+            TokenType.PRINT: self.print_statement,
+            TokenType.LBRACE: self.block,
+            TokenType.IDENTIFIER: self.assignment,
+        }
 
     def error(self, message: str):
         token = self.current_token()
-        raise Exception(f"Parser error at line {token.line}: {message}")
+        raise DiagnosticError(Diagnostic("Parser", message, token.line, token.column))
+
+    def synchronize(self):
+        depth = 0
+        while not self.check(TokenType.EOF):
+            token_type = self.current_token().type
+            if token_type is TokenType.LBRACE:
+                depth += 1
+            elif token_type is TokenType.RBRACE:
+                if depth == 0:
+                    if self.block_depth == 0:
+                        self.advance()
+                    return
+                depth -= 1
+                if depth == 0:
+                    self.advance()
+                    return
+            elif token_type is TokenType.SEMICOLON and depth == 0:
+                self.advance()
+                return
+            self.advance()
 
     def current_token(self) -> Token:
         if self.pos >= len(self.tokens):
@@ -43,56 +94,61 @@ class Parser:
             self.pos += 1
         return token
 
-    def match(self, *types: TokenType) -> bool:
+    def check(self, token_type: TokenType) -> bool:
+        return self.current_token().type is token_type
+
+    def check_any(self, types: FrozenSet[TokenType]) -> bool:
         return self.current_token().type in types
 
     def consume(self, token_type: TokenType, message: str = "") -> Token:
-        if self.current_token().type == token_type:
+        if self.current_token().type is token_type:
             return self.advance()
         self.error(message or f"Expected {token_type}")
 
     def skip_newlines(self):
-        while self.match(TokenType.NEWLINE):
+        while self.check(TokenType.NEWLINE):
             self.advance()
 
     def parse(self) -> Program:
         statements = []
         self.skip_newlines()
 
-        while not self.match(TokenType.EOF):
-            stmt = self.statement()
+        while not self.check(TokenType.EOF):
+            stmt = self.recovering_statement()
             if stmt:
                 statements.append(stmt)
             self.skip_newlines()
 
         return Program(statements)
 
+    def recovering_statement(self) -> Optional[ASTNode]:
+        if not self.recover:
+            return self.statement()
+
+        try:
+            return self.statement()
+        except DiagnosticError as e:
+            self.diagnostics.append(e.diagnostic)
+            self.synchronize()
+            return None
+
     def statement(self) -> Optional[ASTNode]:
         self.skip_newlines()
 
-        if self.match(TokenType.INT, TokenType.STRING_TYPE, TokenType.BOOLEAN_TYPE):
-            return self.var_declaration()
-        elif self.match(TokenType.IF):
-            return self.if_statement()
-        elif self.match(TokenType.WHILE):
-            return self.while_statement()
-        elif self.match(TokenType.PRINT):
-            return self.print_statement()
-        elif self.match(TokenType.LBRACE):
-            return self.block()
-        elif self.match(TokenType.IDENTIFIER):
-            return self.assignment()
-        else:
-            expr = self.expression()
-            self.consume(TokenType.SEMICOLON, "Expected ';' after expression")
-            return expr
+        statement_parser = self.statement_parsers.get(self.current_token().type)
+        if statement_parser:
+            return statement_parser()
+
+        expr = self.expression()
+        self.consume(TokenType.SEMICOLON, "Expected ';' after expression")
+        return expr
 
     def var_declaration(self) -> VarDeclaration:
         var_type = self.advance().value
         name = self.consume(TokenType.IDENTIFIER, "Expected variable name").value
 
         value = None
-        if self.match(TokenType.ASSIGN):
+        if self.check(TokenType.ASSIGN):
             self.advance()
             value = self.expression()
 
@@ -115,7 +171,8 @@ class Parser:
         then_branch = self.statement()
         else_branch = None
 
-        if self.match(TokenType.ELSE):
+        self.skip_newlines()
+        if self.check(TokenType.ELSE):
             self.advance()
             else_branch = self.statement()
 
@@ -141,14 +198,18 @@ class Parser:
         self.advance()
         statements = []
 
-        self.skip_newlines()
-        while not self.match(TokenType.RBRACE) and not self.match(TokenType.EOF):
-            stmt = self.statement()
-            if stmt:
-                statements.append(stmt)
+        self.block_depth += 1
+        try:
             self.skip_newlines()
-
-        self.consume(TokenType.RBRACE, "Expected '}' to close block")
+            while not self.check_any(BLOCK_TERMINATORS):
+                stmt = self.recovering_statement()
+                if stmt:
+                    statements.append(stmt)
+                self.skip_newlines()
+
+            self.consume(TokenType.RBRACE, "Expected '}' to close block")
+        finally:
+            self.block_depth -= 1
         return Block(statements)
 
     def expression(self) -> ASTNode:
@@ -165,7 +226,7 @@ class Parser:
     def equality(self) -> ASTNode:
         expr = self.comparison()
 
-        while self.match(TokenType.EQUAL, TokenType.NOT_EQUAL):
+        while self.check_any(EQUALITY_OPERATORS):
             operator = self.advance()
             right = self.comparison()
             expr = BinaryOp(expr, operator, right)
@@ -175,12 +236,7 @@ class Parser:
     def comparison(self) -> ASTNode:
         expr = self.term()
 
-        while self.match(
-            TokenType.GREATER_THAN,
-            TokenType.GREATER_EQUAL,
-            TokenType.LESS_THAN,
-            TokenType.LESS_EQUAL,
-        ):
+        while self.check_any(COMPARISON_OPERATORS):
             operator = self.advance()
             right = self.term()
             expr = BinaryOp(expr, operator, right)
@@ -190,7 +246,7 @@ class Parser:
     def term(self) -> ASTNode:
         expr = self.factor()
 
-        while self.match(TokenType.PLUS, TokenType.MINUS):
+        while self.check_any(TERM_OPERATORS):
             operator = self.advance()
             right = self.factor()
             expr = BinaryOp(expr, operator, right)
@@ -200,7 +256,7 @@ class Parser:
     def factor(self) -> ASTNode:
         expr = self.unary()
 
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE):
+        while self.check_any(FACTOR_OPERATORS):
             operator = self.advance()
             right = self.unary()
             expr = BinaryOp(expr, operator, right)
@@ -208,7 +264,7 @@ class Parser:
         return expr
 
     def unary(self) -> ASTNode:
-        if self.match(TokenType.MINUS, TokenType.PLUS):
+        if self.check_any(UNARY_OPERATORS):
             operator = self.advance()
             expr = self.unary()
             return UnaryOp(operator, expr)
@@ -216,23 +272,23 @@ class Parser:
         return self.primary()
 
     def primary(self) -> ASTNode:
-        if self.match(TokenType.NUMBER):
+        if self.check(TokenType.NUMBER):
             value = float(self.advance().value)
             return Number(value)
 
-        if self.match(TokenType.STRING):
+        if self.check(TokenType.STRING):
             value = self.advance().value
             return String(value)
 
-        if self.match(TokenType.BOOLEAN):
+        if self.check(TokenType.BOOLEAN):
             value = self.advance().value == "true"
             return Boolean(value)
 
-        if self.match(TokenType.IDENTIFIER):
+        if self.check(TokenType.IDENTIFIER):
             name = self.advance().value
             return Identifier(name)
 
-        if self.match(TokenType.LPAREN):
+        if self.check(TokenType.LPAREN):
             self.advance()
             expr = self.expression()
             self.consume(TokenType.RPAREN, "Expected ')' after expression")
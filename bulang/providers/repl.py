@@ -0,0 +1,88 @@
+from typing import Optional, TextIO
+
+from bulang import run_bulang
+from bulang.providers.interpreter import Interpreter
+
+
+class Repl:
+    PROMPT = "bulang> "
+    CONTINUATION_PROMPT = "....... "
+
+    def __init__(self, output: Optional[TextIO] = None):
+        self.interpreter = Interpreter(output)
+        self.output = output
+        self.buffer = []
+        self.held = False
+
+    def is_complete(self, source: str) -> bool:
+        depth = 0
+        in_string = False
+        for char in source:
+            if char == '"':
+                in_string = not in_string
+            elif in_string:
+                continue
+            elif char == "{":
+                depth += 1
+            elif char == "}":
+                depth -= 1
+
+        stripped = source.rstrip()
+        return depth <= 0 and not in_string and stripped[-1:] in (";", "}")
+
+    def feed(self, line: str) -> bool:
+        # A complete input ending in "}" may still be followed by an else
+        # branch, so it is held until the next line shows whether it is.
+        if self.held and not starts_with_else(line):
+            self.flush()
+            if not line.strip():
+                return True
+
+        self.held = False
+        self.buffer.append(line)
+        source = "\n".join(self.buffer)
+
+        if not source.strip():
+            self.buffer = []
+            return True
+
+        if line.strip() and not self.is_complete(source):
+            return False
+
+        if line.strip() and source.rstrip().endswith("}"):
+            self.held = True
+            return False
+
+        self.flush()
+        return True
+
+    def flush(self):
+        source = "\n".join(self.buffer)
+        self.buffer = []
+        self.held = False
+        if source.strip():
+            run_bulang(source, self.output, self.interpreter)
+
+    def run(self):
+        complete = True
+        while True:
+            try:
+                line = input(self.PROMPT if complete else self.CONTINUATION_PROMPT)
+            except EOFError:
+                print(file=self.output)
+                self.flush()
+                break
+            except KeyboardInterrupt:
+                print(file=self.output)
+                self.buffer = []
+                self.held = False
+                complete = True
+                continue
+
+            complete = self.feed(line)
+
+
+def starts_with_else(line: str) -> bool:
+    stripped = line.lstrip()
+    following = stripped[4:5]
+    return stripped.startswith("else") and not (following.isalnum() or following == "_")
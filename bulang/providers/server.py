@@ -0,0 +1,97 @@
+import io
+import os
+import socket
+import socketserver
+import stat
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from bulang import compile_bulang, run_bulang
+from bulang.providers.client import DEFAULT_SOCKET_PATH
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        header = self.rfile.readline()
+        if not header:
+            return
+
+        output = io.TextIOWrapper(self.wfile, encoding="utf-8", line_buffering=True)
+        try:
+            try:
+                header = header.decode("utf-8").rstrip("\n")
+                if header == "source":
+                    program = self.rfile.read().decode("utf-8")
+                elif header.startswith("path ") and os.path.isabs(header[5:]):
+                    program = self.read_file(header[5:], output)
+                else:
+                    print("Error: Invalid request", file=output)
+                    return
+            except UnicodeDecodeError as e:
+                print(f"Error: Invalid request: {e}", file=output)
+                return
+
+            if program is not None:
+                self.server.execute(program, output)
+        finally:
+            output.flush()
+            output.detach()
+
+    def read_file(self, path: str, output: io.TextIOBase) -> Optional[str]:
+        if not os.path.isfile(path):
+            print(f"File not found: {path}", file=output)
+            return None
+        try:
+            with open(path, "r") as file_reader:
+                return file_reader.read()
+        except (OSError, UnicodeDecodeError) as e:
+            print(f"Error: Cannot read {path}: {e}", file=output)
+            return None
+
+
+class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def __init__(self, socket_path: str = DEFAULT_SOCKET_PATH, cache_size: int = 256):
+        self.socket_path = socket_path
+        self.socket_identity: Optional[Tuple[int, int]] = None
+        remove_stale_socket(socket_path)
+        super().__init__(socket_path, RequestHandler)
+        self.socket_identity = socket_identity(socket_path)
+        self.compile = lru_cache(maxsize=cache_size)(compile_bulang)
+
+    def execute(self, program: str, output: io.TextIOBase):
+        run_bulang(program, output, compiler=self.compile)
+
+    def server_close(self):
+        super().server_close()
+        # Another server may have replaced the path since this one bound it.
+        identity = self.socket_identity
+        if identity is not None and socket_identity(self.socket_path) == identity:
+            os.unlink(self.socket_path)
+        self.socket_identity = None
+
+
+def socket_identity(path: str) -> Optional[Tuple[int, int]]:
+    try:
+        status = os.lstat(path)
+    except FileNotFoundError:
+        return None
+    if not stat.S_ISSOCK(status.st_mode):
+        return None
+    return status.st_dev, status.st_ino
+
+
+def remove_stale_socket(path: str):
+    if not os.path.lexists(path):
+        return
+    if socket_identity(path) is None:
+        raise Exception(f"Refusing to replace {path}: it is not a socket")
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            os.unlink(path)
+            return
+    raise Exception(f"Refusing to replace {path}: a server is already listening")
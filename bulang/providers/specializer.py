@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import math
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Set, TextIO, Tuple
+
+from bulang.enums.token_type_enum import TokenType
+from bulang.models.block import Block
+from bulang.models.operators.assignment import Assignment
+from bulang.models.operators.binary_op import BinaryOp
+from bulang.models.operators.identifier import Identifier
+from bulang.models.operators.unray_op import UnaryOp
+from bulang.models.statements.if_statement import IfStatement
+from bulang.models.statements.print_statement import PrintStatement
+from bulang.models.statements.while_statement import WhileStatement
+from bulang.models.types.number import Number
+from bulang.models.var_declaration import VarDeclaration
+from bulang.providers.interpreter import divide
+
+if TYPE_CHECKING:
+    from bulang.models.ast_node import ASTNode
+    from bulang.providers.environment import Environment
+
+HOT_LOOP_THRESHOLD = 50
+GUARD_FAILURE_LIMIT = 8
+
+ARITHMETIC_OPERATORS = {
+    TokenType.PLUS: "+",
+    TokenType.MINUS: "-",
+    TokenType.MULTIPLY: "*",
+}
+COMPARISON_OPERATORS = {
+    TokenType.EQUAL: "==",
+    TokenType.NOT_EQUAL: "!=",
+    TokenType.LESS_THAN: "<",
+    TokenType.GREATER_THAN: ">",
+    TokenType.LESS_EQUAL: "<=",
+    TokenType.GREATER_EQUAL: ">=",
+}
+UNARY_OPERATORS = {
+    TokenType.MINUS: "-",
+    TokenType.PLUS: "+",
+}
+
+
+class Unsupported(Exception):
+    pass
+
+
+class SpecializedLoop:
+    def __init__(self, names: List[str], function: Callable):
+        self.names = names
+        self.function = function
+        self.guard_failures = 0
+
+    def run(self, environment: Environment, result: Any) -> Tuple[bool, Any]:
+        frames = []
+        values = []
+        for name in self.names:
+            frame = environment
+            while frame is not None and name not in frame.variables:
+                frame = frame.parent
+            if frame is None:
+                return False, result
+            value = frame.variables[name]
+            if type(value) is not float and type(value) is not int:
+                return False, result
+            frames.append(frame)
+            values.append(value)
+
+        state = []
+        try:
+            self.function(state, result, *values)
+        finally:
+            for frame, name, value in zip(frames, self.names, state[1:]):
+                frame.variables[name] = value
+        return True, state[0]
+
+
+class LoopCompiler:
+    """Translates a WhileStatement over numeric variables into a Python loop.
+
+    Every value the generated code stores is a number, so the only guard
+    needed is that each free variable holds a number when the loop is
+    entered. Anything else raises Unsupported and the loop stays generic.
+    """
+
+    def __init__(self, node: WhileStatement):
+        self.node = node
+        self.declared: Set[str] = set()
+        self.free: List[str] = []
+        self.scopes: List[Set[str]] = []
+        self.locals: Dict[str, str] = {}
+        self.lines: List[str] = []
+        self.collect_declarations(node)
+
+    def collect_declarations(self, node: ASTNode):
+        if isinstance(node, VarDeclaration):
+            if node.name in self.declared:
+                raise Unsupported(f"{node.name} is declared more than once")
+            self.declared.add(node.name)
+        elif isinstance(node, Block):
+            for statement in node.statements:
+                self.collect_declarations(statement)
+        elif isinstance(node, IfStatement):
+            self.collect_declarations(node.then_branch)
+            if node.else_branch:
+                self.collect_declarations(node.else_branch)
+        elif isinstance(node, WhileStatement):
+            self.collect_declarations(node.body)
+
+    def variable(self, name: str) -> str:
+        if name in self.declared:
+            if not any(name in scope for scope in self.scopes):
+                raise Unsupported(f"{name} is used outside its scope")
+        elif name not in self.free:
+            self.free.append(name)
+
+        # Bulang names are not always valid (or distinct) Python identifiers,
+        # so each one gets a positional local instead.
+        if name not in self.locals:
+            self.locals[name] = f"v{len(self.locals)}"
+        return self.locals[name]
+
+    def emit(self, depth: int, line: str):
+        self.lines.append("    " * depth + line)
+
+    def compile(self, output: Optional[TextIO] = None) -> SpecializedLoop:
+        self.emit(2, "try:")
+        self.loop(self.node, 3)
+        self.emit(2, "finally:")
+        values = "".join(f"{self.locals[name]}, " for name in self.free)
+        self.emit(3, f"state.extend((_r, {values}))")
+
+        parameters = "".join(f", {self.locals[name]}" for name in self.free)
+        source = "\n".join(
+            ["def build(divide, output):", f"    def loop(state, _r{parameters}):"]
+            + self.lines
+            + ["    return loop"]
+        )
+        try:
+            code = compile(source, "<bulang specialized loop>", "exec")
+        except SyntaxError as e:
+            raise Unsupported(f"Cannot compile specialized loop: {e}")
+        namespace: Dict[str, Any] = {}
+        exec(code, namespace)
+        return SpecializedLoop(list(self.free), namespace["build"](divide, output))
+
+    def loop(self, node: WhileStatement, depth: int):
+        self.emit(depth, f"while {self.condition(node.condition)}:")
+        self.branch(node.body, depth + 1)
+
+    def branch(self, node: ASTNode, depth: int):
+        # An unbraced declaration defines its name in the enclosing frame
+        # only when the branch runs, which a Python local cannot express.
+        if isinstance(node, VarDeclaration):
+            raise Unsupported("Declarations in unbraced branches are not supported")
+        self.statement(node, depth)
+
+    def statement(self, node: ASTNode, depth: int):
+        if isinstance(node, Block):
+            self.scopes.append(set())
+            if not node.statements:
+                self.emit(depth, "_r = None")
+            for statement in node.statements:
+                self.statement(statement, depth)
+            self.scopes.pop()
+        elif isinstance(node, VarDeclaration):
+            if not self.scopes or node.var_type != "int":
+                raise Unsupported("Only int declarations inside a block are supported")
+            value = self.number(node.value) if node.value else "0"
+            self.scopes[-1].add(node.name)
+            self.emit(depth, f"_r = {self.variable(node.name)} = {value}")
+        elif isinstance(node, Assignment):
+            value = self.number(node.value)
+            self.emit(depth, f"_r = {self.variable(node.name)} = {value}")
+        elif isinstance(node, IfStatement):
+            self.emit(depth, f"if {self.condition(node.condition)}:")
+            self.branch(node.then_branch, depth + 1)
+            self.emit(depth, "else:")
+            if node.else_branch:
+                self.branch(node.else_branch, depth + 1)
+            else:
+                self.emit(depth + 1, "_r = None")
+        elif isinstance(node, WhileStatement):
+            self.emit(depth, "_r = None")
+            self.loop(node, depth)
+        elif isinstance(node, PrintStatement):
+            self.emit(depth, f"_r = {self.value(node.expression)}")
+            self.emit(depth, "print(_r, file=output)")
+        else:
+            self.emit(depth, f"_r = {self.value(node)}")
+
+    def condition(self, node: ASTNode) -> str:
+        if self.is_comparison(node):
+            return self.comparison(node)
+        return f"{self.number(node)} != 0"
+
+    def value(self, node: ASTNode) -> str:
+        if self.is_comparison(node):
+            return self.comparison(node)
+        return self.number(node)
+
+    def is_comparison(self, node: ASTNode) -> bool:
+        return isinstance(node, BinaryOp) and node.operator.type in COMPARISON_OPERATORS
+
+    def comparison(self, node: BinaryOp) -> str:
+        left = self.number(node.left)
+        right = self.number(node.right)
+        return f"({left} {COMPARISON_OPERATORS[node.operator.type]} {right})"
+
+    def number(self, node: ASTNode) -> str:
+        if isinstance(node, Number):
+            if not math.isfinite(node.value):
+                raise Unsupported(f"Cannot specialize literal {node.value}")
+            return repr(node.value)
+        if isinstance(node, Identifier):
+            return self.variable(node.name)
+        if isinstance(node, UnaryOp) and node.operator.type in UNARY_OPERATORS:
+            return f"({UNARY_OPERATORS[node.operator.type]}{self.number(node.operand)})"
+        if isinstance(node, BinaryOp):
+            left = self.number(node.left)
+            right = self.number(node.right)
+            if node.operator.type is TokenType.DIVIDE:
+                return f"divide({left}, {right})"
+            if node.operator.type in ARITHMETIC_OPERATORS:
+                return f"({left} {ARITHMETIC_OPERATORS[node.operator.type]} {right})"
+        raise Unsupported(f"Cannot specialize {type(node).__name__}")
+
+
+class LoopSpecializer:
+    def __init__(self, output: Optional[TextIO] = None, threshold: int = HOT_LOOP_THRESHOLD):
+        self.output = output
+        self.threshold = threshold
+        self.counts: Dict[WhileStatement, int] = {}
+        self.loops: Dict[WhileStatement, Optional[SpecializedLoop]] = {}
+
+    def loop_for(self, node: WhileStatement) -> Optional[SpecializedLoop]:
+        if node in self.loops:
+            return self.loops[node]
+
+        count = self.counts.get(node, 0) + 1
+        self.counts[node] = count
+        if count < self.threshold:
+            return None
+
+        try:
+            loop = LoopCompiler(node).compile(self.output)
+        except Unsupported:
+            loop = None
+        self.loops[node] = loop
+        return loop
+
+    def run(self, node: WhileStatement, environment: Environment, result: Any):
+        loop = self.loop_for(node)
+        if loop is None:
+            return False, result
+
+        done, result = loop.run(environment, result)
+        if not done:
+            loop.guard_failures += 1
+            if loop.guard_failures >= GUARD_FAILURE_LIMIT:
+                self.loops[node] = None
+        return done, result
@@ -1,4 +1,17 @@
+import io
+import os
+import socket
+import tempfile
+import threading
+
 from bulang import run_bulang
+from bulang.providers.checker import check_source
+from bulang.providers.client import Client
+from bulang.providers.interpreter import Interpreter
+from bulang.providers.metrics import Metrics
+from bulang.providers.metrics_exporter import PrometheusExporter
+from bulang.providers.repl import Repl
+from bulang.providers.server import Server
 
 if __name__ == "__main__":
     test_programs = [
@@ -29,6 +42,21 @@ while (i < 5) {
     i = i + 1;
 }
         """,
+        """
+string s = "0123456789012345678901234567890123456789012345678901234567890123";
+string a = s + "X";
+string b = s + "Y";
+s = s + "Z";
+print(a);
+print(b);
+print(s);
+print(a == b);
+string base = a;
+a = a + "!";
+print(base);
+print(a);
+print(base + "X" == s + "X");
+        """,
     ]
 
     for i, program in enumerate(test_programs):
@@ -38,3 +66,256 @@ while (i < 5) {
         print("\nOutput:")
         run_bulang(program)
         print("-" * 30)
+
+    # Each session runs its programs in order on one interpreter, once with
+    # hot loop specialization and once without; both runs must agree.
+    specialization_sessions = [
+        [
+            """
+int i = 0;
+int x = 0;
+int step = 1;
+while (i < 200) {
+    int j = 0;
+    while (j < 3) {
+        x = x + step;
+        j = j + 1;
+    }
+    if (i == 100) {
+        step = true;
+    }
+    i = i + 1;
+}
+print(x);
+            """,
+        ],
+        [
+            """
+int x = 5;
+int total = 0;
+int i = 0;
+while (i < 100) {
+    int x = i * 2;
+    total = total + x;
+    i = i + 1;
+}
+print(x);
+print(total);
+            """,
+        ],
+        [
+            """
+int i = 0;
+int d = 100;
+int total = 0;
+while (i < 200) {
+    i = i + 1;
+    if (i == 150) {
+        d = 0;
+    }
+    total = total + 1000 / d;
+}
+            """,
+            """
+print(i);
+print(d);
+print(total);
+            """,
+        ],
+        [
+            """
+int i = 0;
+int total = 0;
+while (i < 100) {
+    total = total + i;
+    i = i + 1;
+}
+            """,
+            """
+int k = 0;
+while (k < 100) {
+    k = k + 1;
+    if (k > 1000) {
+        print(k);
+    }
+}
+            """,
+        ],
+        [
+            """
+int i = 0;
+int t = 100;
+while (i < 100) {
+    if (i > 1000) int t = 1;
+    t = t + 1;
+    i = i + 1;
+}
+print(t);
+            """,
+        ],
+        [
+            """
+int x² = 0;
+int ﬁ = 0;
+int fi = 5;
+while (x² < 100) {
+    x² = x² + 1;
+    ﬁ = ﬁ + 1;
+    fi = fi + 2;
+}
+print(x²);
+print(ﬁ);
+print(fi);
+            """,
+        ],
+    ]
+
+    for i, session in enumerate(specialization_sessions):
+        print(f"\n--- Specialization Session {i + 1} ---")
+        runs = []
+        for specialize in (True, False):
+            output = io.StringIO()
+            interpreter = Interpreter(output, specialize)
+            results = [run_bulang(program, output, interpreter) for program in session]
+            runs.append((output.getvalue(), results))
+
+        output, results = runs[0]
+        print("Output:")
+        print(output.strip())
+        print(f"Results: {results}")
+        print(f"Matches generic interpreter: {runs[0] == runs[1]}")
+        print("-" * 30)
+
+    # Every error in a recovered source is reported once, with its column;
+    # the same source without recovery stops at the first parser error.
+    checked_source = """
+int x = ;
+print(x);
+if (x > 1) {
+    int y = 2
+    print(y);
+}
+}
+string s = "ok" $ 3;
+while (x < 3) {
+    x = ;
+}
+print(s);
+"""
+
+    print("\n--- Check ---")
+    program, diagnostics = check_source(checked_source)
+    print(f"Statements recovered: {len(program.statements)}")
+    for diagnostic in diagnostics:
+        print(f"{diagnostic.line}:{diagnostic.column} {diagnostic}")
+    print("Without recovery:")
+    run_bulang(checked_source.replace("$ 3", ""))
+    print("-" * 30)
+
+    # Counters for a small script, including an expression statement and an
+    # unbraced loop body; then two runs merged through one .prom file.
+    metrics_program = """
+int x = 1;
+1 + x;
+if (x > 0) {
+    x = 2;
+}
+while (x < 4) x = x + 1;
+print(x);
+"""
+
+    print("\n--- Metrics ---")
+    metrics = Metrics()
+    run_bulang(metrics_program, metrics=metrics)
+    print(f"Counters: {metrics.counters}")
+
+    failed = Metrics()
+    run_bulang("print(y);", io.StringIO(), metrics=failed)
+    with tempfile.TemporaryDirectory() as directory:
+        prom_path = os.path.join(directory, "bulang.prom")
+        PrometheusExporter(prom_path).export(failed, {"run": 1})
+        PrometheusExporter(prom_path).export(metrics, {"run": 1})
+        PrometheusExporter(prom_path).export(failed, {"run": "2", "script": 'a "b"'})
+        for labels, record in PrometheusExporter(prom_path).read().items():
+            print(f"{labels}: error={record['error']} counters={record['counters']}")
+    print("-" * 30)
+
+    # Lines fed to one REPL, one per prompt; each result is whether the
+    # REPL would show the primary prompt next.
+    repl_lines = [
+        "int x = 1;",
+        "if (x > 0) {",
+        '    print("positive");',
+        "}",
+        "else {",
+        '    print("negative");',
+        "}",
+        "x = x + 1;",
+        "while (x < 4) { x = x + 1; }",
+        "",
+        "print(x);",
+    ]
+
+    print("\n--- REPL ---")
+    repl_output = io.StringIO()
+    repl = Repl(repl_output)
+    print(f"is_complete('int x = 1;'): {repl.is_complete('int x = 1;')}")
+    print(f"is_complete('if (x) {{'): {repl.is_complete('if (x) {')}")
+    print(f"is_complete('print(\"{{\");'): {repl.is_complete('print(\"{\");')}")
+    for line in repl_lines:
+        complete = repl.feed(line)
+        print(f"{line!r:<34} -> {complete}")
+    print("Output:")
+    print(repl_output.getvalue().strip())
+    print("-" * 30)
+
+    def send_raw(socket_path: str, request: bytes) -> str:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(socket_path)
+            sock.sendall(request)
+            sock.shutdown(socket.SHUT_WR)
+            with sock.makefile("r", encoding="utf-8") as reader:
+                return reader.read()
+
+    print("\n--- Server ---")
+    with tempfile.TemporaryDirectory() as directory:
+        socket_path = os.path.join(directory, "bulang.sock")
+        script_path = os.path.join(directory, "script.bl")
+        with open(script_path, "w") as file_writer:
+            file_writer.write("print(6 * 7);")
+
+        with Server(socket_path) as server:
+            thread = threading.Thread(target=server.serve_forever, daemon=True)
+            thread.start()
+            try:
+                try:
+                    Server(socket_path)
+                except Exception as e:
+                    print(f"Second server: {e}".replace(directory, "<tmp>"))
+
+                client = Client(socket_path)
+                for label, send in [
+                    ("run_file", lambda output: client.run_file(script_path, output)),
+                    ("run_source", lambda output: client.run_source("print(1 + 2);", output)),
+                ]:
+                    output = io.StringIO()
+                    send(output)
+                    print(f"{label}: {output.getvalue().strip()}")
+
+                for request in [
+                    b'{"source": "print(1);"}\n',
+                    b"[1]\n",
+                    b"path relative.bl\n",
+                    b"path \xff\n",
+                    b"source\n\xff",
+                ]:
+                    print(f"{request!r}: {send_raw(socket_path, request).strip()}")
+            finally:
+                server.shutdown()
+        print(f"Socket removed on close: {not os.path.exists(socket_path)}")
+
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as stale:
+            stale.bind(socket_path)
+        with Server(socket_path):
+            print("Stale socket replaced: True")
+    print("-" * 30)